@@ -5,15 +5,30 @@ Polls GitHub/GitLab for issues labeled 'ready' and queues them for processing
 Phase 1.1: Multi-project support
 """
 
+import re
 import time
 import sys
 import json
+import hmac
+import hashlib
 import logging
+import threading
 import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Any, BinaryIO, Dict, List, Optional, Set
+from collections import defaultdict
 from datetime import datetime
 
+# orjson is optional; used for faster JSON encode/decode when installed
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +37,41 @@ logging.basicConfig(
 )
 logger = logging.getLogger('issue-watcher')
 
+# Markdown section parsing: '## Header' lines and list items ('1.', '-', '*', '[ ]', '[x]')
+_HEADER_RE = re.compile(r'\s*##+\s*(.*?)\s*$')
+_BULLET_RE = re.compile(r'[1-9]\.|[-*]|\[[ x]\]')
+
+# Issue labels that set task complexity
+_COMPLEXITY_LABELS = frozenset(('simple', 'medium', 'complex'))
+
+# Rewrite processed_issues.jsonl from memory after this many appends
+PROCESSED_LOG_COMPACT_EVERY = 1000
+
+# Back off until the rate limit window resets once fewer requests than this remain
+RATE_LIMIT_MIN_REMAINING = 10
+
+# Polling interval used as a failsafe while the webhook receiver is running
+WEBHOOK_FALLBACK_POLL_SECONDS = 300
+
+# GitHub caps webhook payloads at 25 MB; anything larger is rejected unread
+WEBHOOK_MAX_PAYLOAD_BYTES = 25 * 1024 * 1024
+
+
+def json_loads(data):
+    """Decode JSON from str or bytes"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent: bool = False) -> bytes:
+    """Encode object to UTF-8 JSON bytes"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(',', ':')).encode()
+
 
 class ProjectWatcher:
     """Monitors a single project's GitHub/GitLab for ready-to-process issues"""
@@ -41,9 +91,35 @@ class ProjectWatcher:
         self.platform = project_config['git_platform']
         self.repository = project_config['repository']
 
+        # Parse owner/repo once from repository URL or string
+        repo_parts = self.repository.rstrip('/').split('/')
+        if len(repo_parts) < 2 or not repo_parts[-2] or not repo_parts[-1]:
+            raise ValueError(f"Invalid repository (expected URL or owner/repo): '{self.repository}'")
+        self.owner = repo_parts[-2]
+        self.repo = repo_parts[-1]
+        self._github_issues_url = f"https://api.github.com/repos/{self.owner}/{self.repo}/issues"
+        self._gitlab_project_path = requests.utils.quote(f"{self.owner}/{self.repo}", safe='')
+
+        # GitLab numeric project ID (resolved from repository path on first poll if not configured)
+        self._gitlab_project_id: Optional[int] = project_config.get('project_id')
+
         # Load API token (project-specific or shared)
         self.token = self.load_token()
 
+        # Persistent HTTP session (keep-alive across poll cycles)
+        self.session = self.create_session()
+
+        # Label updates for one project run one at a time (GitHub secondary rate limits)
+        self._label_lock = threading.Lock()
+
+        # Conditional request cache (url -> {'etag': ..., 'issues': [...]})
+        self.etag_cache: Dict[str, Dict] = {}
+        self.etag_cache_dirty = False
+
+        # Adaptive polling: epoch seconds before which this project is not polled again
+        self.poll_interval = global_config.get('poll_interval_seconds', 60)
+        self.next_allowed_poll = 0.0
+
         logger.info(f"  [{self.project_id}] {self.project_name} ({self.project_type})")
         logger.info(f"    Repository: {self.repository}")
 
@@ -75,8 +151,90 @@ class ProjectWatcher:
             logger.error(f"[{self.project_id}] Failed to read token: {e}")
             raise
 
+    def create_session(self) -> requests.Session:
+        """Create HTTP session with auth headers and connection pooling"""
+        session = requests.Session()
+
+        if self.platform == 'github':
+            session.headers.update({
+                'Authorization': f'token {self.token}',
+                'Accept': 'application/vnd.github.v3+json'
+            })
+        elif self.platform == 'gitlab':
+            session.headers.update({'PRIVATE-TOKEN': self.token})
+
+        # Retry transient server errors without dropping pooled connections
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=retries)
+        session.mount('https://', adapter)
+
+        return session
+
+    def close(self):
+        """Close HTTP session and release pooled connections"""
+        self.session.close()
+
+    def conditional_get(self, url: str, params: Dict) -> Optional[requests.Response]:
+        """GET with If-None-Match, returns None if the cached issue list is still current"""
+        headers = {}
+        cached = self.etag_cache.get(url)
+        if cached:
+            headers['If-None-Match'] = cached['etag']
+
+        response = self.session.get(url, params=params, headers=headers, timeout=30)
+        self.schedule_next_poll(response)
+
+        if response.status_code == 304 and cached:
+            return None
+
+        response.raise_for_status()
+        return response
+
+    def remember_response(self, url: str, response: requests.Response, issues: List[Dict]):
+        """Cache parsed issue list under the response ETag"""
+        etag = response.headers.get('ETag')
+        cached = self.etag_cache.get(url)
+        if etag:
+            # Same ETag means same content; only a new one needs persisting
+            if not cached or cached['etag'] != etag:
+                self.etag_cache[url] = {'etag': etag, 'issues': issues}
+                self.etag_cache_dirty = True
+        elif cached:
+            del self.etag_cache[url]
+            self.etag_cache_dirty = True
+
+    def schedule_next_poll(self, response: requests.Response):
+        """Pick next poll time from API hints (X-Poll-Interval, Retry-After, rate limit)"""
+        headers = response.headers
+        now = time.time()
+
+        poll_hint = headers.get('X-Poll-Interval', '')
+        delay = max(int(poll_hint) if poll_hint.isdigit() else 0, self.poll_interval)
+
+        retry_after = headers.get('Retry-After', '')
+        remaining = headers.get('X-RateLimit-Remaining', headers.get('RateLimit-Remaining', ''))
+        reset = headers.get('X-RateLimit-Reset', headers.get('RateLimit-Reset', ''))
+
+        if retry_after.isdigit():
+            delay = max(delay, int(retry_after))
+            logger.warning(f"[{self.project_id}] Rate limited, backing off for {delay}s")
+        elif remaining.isdigit() and int(remaining) < RATE_LIMIT_MIN_REMAINING and reset.isdigit():
+            delay = max(delay, int(reset) - now)
+            logger.warning(f"[{self.project_id}] Rate limit nearly exhausted ({remaining} left), "
+                           f"backing off for {int(delay)}s")
+
+        self.next_allowed_poll = now + delay
+
     def fetch_ready_issues(self) -> List[Dict]:
         """Fetch issues with 'ready' label from GitHub/GitLab"""
+        now = time.time()
+        if now < self.next_allowed_poll:
+            logger.debug(f"[{self.project_id}] Skipping poll (next poll in {int(self.next_allowed_poll - now)}s)")
+            return []
+
+        # Default schedule; API responses may push this further out
+        self.next_allowed_poll = now + self.poll_interval
+
         try:
             if self.platform == 'github':
                 return self.fetch_github_issues()
@@ -94,78 +252,98 @@ class ProjectWatcher:
 
     def fetch_github_issues(self) -> List[Dict]:
         """Fetch from GitHub API"""
-        # Parse owner/repo from repository URL or string
-        repo_parts = self.repository.rstrip('/').split('/')
-        owner = repo_parts[-2]
-        repo = repo_parts[-1]
-
-        url = f"https://api.github.com/repos/{owner}/{repo}/issues"
-        headers = {
-            'Authorization': f'token {self.token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
+        url = self._github_issues_url
         params = {
             'labels': 'ready',
             'state': 'open',
             'sort': 'created',
-            'direction': 'asc'
+            'direction': 'asc',
+            'per_page': 100
         }
 
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
+        response = self.conditional_get(url, params)
+        if response is None:
+            return self.etag_cache[url]['issues']
 
         issues = []
-        for issue in response.json():
+        for issue in json_loads(response.content):
             # Skip pull requests (they appear as issues in GitHub API)
             if 'pull_request' in issue:
                 continue
 
-            issues.append({
-                'id': issue['number'],
-                'title': issue['title'],
-                'body': issue['body'] or '',
-                'labels': [l['name'] for l in issue['labels']],
-                'url': issue['html_url'],
-                'created_at': issue['created_at']
-            })
+            issues.append(self.github_issue_fields(issue))
 
+        self.remember_response(url, response, issues)
         return issues
 
+    @staticmethod
+    def github_issue_fields(issue: Dict) -> Dict:
+        """Extract the fields we use from a GitHub issue object (API or webhook payload)"""
+        return {
+            'id': issue['number'],
+            'title': issue['title'],
+            'body': issue['body'] or '',
+            'labels': [l['name'] for l in issue['labels']],
+            'url': issue['html_url'],
+            'created_at': issue['created_at']
+        }
+
+    def ensure_github_webhook(self, webhook_url: str, secret: str):
+        """Subscribe repository 'issues' events to our webhook receiver (once)"""
+        hooks_url = f"https://api.github.com/repos/{self.owner}/{self.repo}/hooks"
+        try:
+            response = self.session.get(hooks_url, timeout=30)
+            response.raise_for_status()
+            if any(hook.get('config', {}).get('url') == webhook_url for hook in json_loads(response.content)):
+                logger.info(f"[{self.project_id}] Webhook already registered")
+                return
+
+            data: Dict[str, Any] = {
+                'name': 'web',
+                'active': True,
+                'events': ['issues'],
+                'config': {'url': webhook_url, 'content_type': 'json', 'secret': secret}
+            }
+            response = self.session.post(hooks_url, json=data, timeout=30)
+            response.raise_for_status()
+            logger.info(f"[{self.project_id}] ✅ Webhook registered: {webhook_url}")
+        except Exception as e:
+            logger.warning(f"[{self.project_id}] Failed to register webhook (polling still active): {e}")
+
     def fetch_gitlab_issues(self) -> List[Dict]:
         """Fetch from GitLab API"""
-        # Get project ID from config or parse from URL
-        project_id = self.project_config.get('project_id')
+        # Get project ID from config, previous lookup, or parse from URL
+        project_id = self._gitlab_project_id
+        response: Optional[requests.Response]
 
-        if not project_id:
+        if project_id is None:
             # Try to get project ID from API using project path
-            project_path = self.repository.rstrip('/').split('/')[-2:]
-            project_path_str = '/'.join(project_path)
-
-            url = f"https://gitlab.com/api/v4/projects/{requests.utils.quote(project_path_str, safe='')}"
-            headers = {'PRIVATE-TOKEN': self.token}
+            url = f"https://gitlab.com/api/v4/projects/{self._gitlab_project_path}"
 
             try:
-                response = requests.get(url, headers=headers, timeout=30)
+                response = self.session.get(url, timeout=30)
                 response.raise_for_status()
-                project_id = response.json()['id']
+                project_id = json_loads(response.content)['id']
+                self._gitlab_project_id = project_id
             except Exception as e:
                 logger.error(f"[{self.project_id}] Failed to get GitLab project ID: {e}")
                 return []
 
         url = f"https://gitlab.com/api/v4/projects/{project_id}/issues"
-        headers = {'PRIVATE-TOKEN': self.token}
         params = {
             'labels': 'ready',
             'state': 'opened',
             'order_by': 'created_at',
-            'sort': 'asc'
+            'sort': 'asc',
+            'per_page': 100
         }
 
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        response.raise_for_status()
+        response = self.conditional_get(url, params)
+        if response is None:
+            return self.etag_cache[url]['issues']
 
         issues = []
-        for issue in response.json():
+        for issue in json_loads(response.content):
             issues.append({
                 'id': issue['iid'],
                 'title': issue['title'],
@@ -175,18 +353,15 @@ class ProjectWatcher:
                 'created_at': issue['created_at']
             })
 
+        self.remember_response(url, response, issues)
         return issues
 
     def parse_issue(self, issue: Dict) -> Dict:
         """Extract structured data from issue and add project context"""
         body = issue['body']
 
-        # Extract complexity from labels or body
-        complexity = 'medium'  # default
-        for label in issue['labels']:
-            if label in ['simple', 'medium', 'complex']:
-                complexity = label
-                break
+        # Extract complexity from labels (first match wins, default medium)
+        complexity = next((l for l in issue['labels'] if l in _COMPLEXITY_LABELS), 'medium')
 
         # Parse sections from markdown body
         sections = self.parse_markdown_sections(body)
@@ -224,22 +399,23 @@ class ProjectWatcher:
         """Parse markdown body into sections"""
         sections = {}
         current_section = None
-        current_content = []
+        current_content: List[str] = []
 
         for line in body.split('\n'):
             # Check for section headers (## Header)
-            if line.strip().startswith('##'):
+            header = _HEADER_RE.match(line)
+            if header:
                 # Save previous section
                 if current_section:
                     sections[current_section] = current_content
 
                 # Start new section
-                current_section = line.strip().lstrip('#').strip()
+                current_section = header.group(1)
                 current_content = []
             elif current_section:
                 # Add content to current section
                 stripped = line.strip()
-                if stripped and (stripped.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.', '-', '*', '[ ]', '[x]'))):
+                if _BULLET_RE.match(stripped):
                     current_content.append(stripped)
 
         # Save last section
@@ -248,6 +424,12 @@ class ProjectWatcher:
 
         return sections
 
+    def update_labels(self, issues: List[Dict]):
+        """Update labels on issues in order, one request at a time for this project"""
+        with self._label_lock:
+            for issue in issues:
+                self.update_issue_labels(issue)
+
     def update_issue_labels(self, issue: Dict):
         """Remove 'ready' label and add 'in-queue' label"""
         try:
@@ -259,51 +441,34 @@ class ProjectWatcher:
             logger.error(f"[{self.project_id}] Failed to update labels for issue #{issue['id']}: {e}")
 
     def update_github_labels(self, issue: Dict):
-        """Update GitHub issue labels using gh CLI"""
-        import subprocess
-
-        repo_parts = self.repository.rstrip('/').split('/')
-        owner = repo_parts[-2]
-        repo = repo_parts[-1]
-        repo_name = f"{owner}/{repo}"
+        """Update GitHub issue labels via REST API"""
+        labels_url = f"{self._github_issues_url}/{issue['id']}/labels"
 
         try:
-            # Remove 'ready' label using gh CLI
-            result = subprocess.run(
-                ['gh', 'issue', 'edit', str(issue['id']), '--repo', repo_name, '--remove-label', 'ready'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                logger.warning(f"[{self.project_id}] Failed to remove 'ready' label: {result.stderr}")
-
-            # Add 'in-queue' label using gh CLI
-            result = subprocess.run(
-                ['gh', 'issue', 'edit', str(issue['id']), '--repo', repo_name, '--add-label', 'in-queue'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode != 0:
-                logger.warning(f"[{self.project_id}] Failed to add 'in-queue' label: {result.stderr}")
+            # Remove 'ready' label (404 means it is already gone)
+            response = self.session.delete(f"{labels_url}/ready", timeout=30)
+            if response.status_code not in [200, 204, 404]:
+                logger.warning(f"[{self.project_id}] Failed to remove 'ready' label: {response.status_code}")
+
+            # Add 'in-queue' label
+            response = self.session.post(labels_url, json={'labels': ['in-queue']}, timeout=30)
+            if response.status_code not in [200, 201]:
+                logger.warning(f"[{self.project_id}] Failed to add 'in-queue' label: {response.status_code}")
             else:
                 logger.info(f"[{self.project_id}] ✅ Labels updated: ready → in-queue")
 
-        except subprocess.TimeoutExpired:
-            logger.error(f"[{self.project_id}] Timeout updating labels via gh CLI")
+        except requests.exceptions.Timeout:
+            logger.error(f"[{self.project_id}] Timeout updating labels via GitHub API")
         except Exception as e:
             logger.error(f"[{self.project_id}] Error updating labels: {e}")
 
     def update_gitlab_labels(self, issue: Dict):
         """Update GitLab issue labels"""
-        project_id = self.project_config.get('project_id')
-        if not project_id:
+        project_id = self._gitlab_project_id
+        if project_id is None:
             logger.warning(f"[{self.project_id}] GitLab project_id not configured, cannot update labels")
             return
 
-        headers = {'PRIVATE-TOKEN': self.token}
-
         # Get current labels
         current_labels = [l for l in issue['labels'] if l != 'ready']
         current_labels.append('processing')
@@ -311,12 +476,59 @@ class ProjectWatcher:
         # Update issue with new labels
         url = f"https://gitlab.com/api/v4/projects/{project_id}/issues/{issue['id']}"
         data = {'labels': ','.join(current_labels)}
-        response = requests.put(url, headers=headers, json=data, timeout=30)
+        response = self.session.put(url, json=data, timeout=30)
 
         if response.status_code not in [200, 201]:
             logger.warning(f"[{self.project_id}] Failed to update GitLab labels: {response.status_code}")
 
 
+class WebhookHandler(BaseHTTPRequestHandler):
+    """Receives GitHub 'issues' webhook events and queues newly ready issues"""
+
+    # Drop clients that stall mid-request instead of tying up a thread
+    timeout = 30
+
+    def do_POST(self):
+        watcher = self.server.watcher
+
+        # Validate declared size before reading anything from an unauthenticated client
+        length = self.headers.get('Content-Length', '')
+        if not (length.isascii() and length.isdigit()):
+            self.send_response(400)
+            self.end_headers()
+            return
+        if int(length) > WEBHOOK_MAX_PAYLOAD_BYTES:
+            self.send_response(413)
+            self.end_headers()
+            return
+
+        body = self.rfile.read(int(length))
+
+        # Verify HMAC signature before trusting the payload (as bytes: header may be non-ASCII)
+        expected = b'sha256=' + hmac.new(watcher.webhook_secret, body, hashlib.sha256).hexdigest().encode()
+        signature = self.headers.get('X-Hub-Signature-256', '').encode('latin-1')
+        if not hmac.compare_digest(expected, signature):
+            logger.warning(f"Rejected webhook with invalid signature from {self.client_address[0]}")
+            self.send_response(401)
+            self.end_headers()
+            return
+
+        # Respond first so GitHub doesn't time out while we queue the task
+        self.send_response(202)
+        self.end_headers()
+
+        if self.headers.get('X-GitHub-Event') != 'issues':
+            return
+
+        try:
+            watcher.handle_webhook_event(json_loads(body))
+        except Exception as e:
+            logger.error(f"Failed to handle webhook event: {e}")
+
+    def log_message(self, format, *args):
+        logger.debug(f"Webhook: {format % args}")
+
+
 class IssueWatcher:
     """Orchestrates monitoring of multiple projects (Phase 1.1)"""
 
@@ -331,9 +543,29 @@ class IssueWatcher:
         # Load projects
         self.project_watchers = self.load_projects()
 
-        # State management (per-project)
+        # Worker threads for fetching all projects concurrently (I/O bound)
+        self.executor = ThreadPoolExecutor(max_workers=min(32, len(self.project_watchers)))
+
+        # Webhook receiver (optional, GitHub only)
+        self.webhook_port = self.config.get('webhook_port')
+        self.webhook_host = self.config.get('webhook_host', '')
+        self.webhook_server = None
+        self.webhook_secret = b''
+
+        # Serializes issue processing between the poll loop and webhook threads
+        self._process_lock = threading.Lock()
+
+        # State management (per-project), persisted as an append-only log
+        self._processed_log: Optional[BinaryIO] = None
+        self._processed_appends = 0
+        self._processed_load_ok = True
         self.processed_issues = self.load_processed_issues()
 
+        # Restore conditional request cache so restarts don't refetch
+        etags = self.load_etags()
+        for project_watcher in self.project_watchers:
+            project_watcher.etag_cache = etags.get(project_watcher.project_id, {})
+
         logger.info(f"Issue Watcher initialized (Phase 1.1 Multi-Project)")
         logger.info(f"  Monitoring {len(self.project_watchers)} project(s)")
         logger.info(f"  Poll interval: {self.poll_interval}s")
@@ -350,13 +582,13 @@ class IssueWatcher:
 
             if self.config_path.suffix in ['.yml', '.yaml']:
                 try:
-                    import yaml
+                    import yaml  # type: ignore[import-untyped]
                     return yaml.safe_load(config_text)
                 except ImportError:
                     logger.error("PyYAML not installed. Install with: pip3 install pyyaml")
                     sys.exit(1)
             else:
-                return json.loads(config_text)
+                return json_loads(config_text)
 
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
@@ -429,32 +661,149 @@ class IssueWatcher:
 
         return watchers
 
-    def load_processed_issues(self) -> Set[str]:
-        """Load set of already-processed issue IDs (format: project-id:issue-number)"""
+    def load_processed_issues(self) -> Dict[str, Set[int]]:
+        """Load already-processed issue numbers per project (format: project-id -> {issue-number})"""
         data_dir = Path.home() / '.config' / 'lazy_birtd' / 'data'
         data_dir.mkdir(parents=True, exist_ok=True)
 
-        processed_file = data_dir / 'processed_issues.json'
+        processed: Dict[str, Set[int]] = defaultdict(set)
+
+        processed_file = data_dir / 'processed_issues.jsonl'
         if processed_file.exists():
             try:
-                data = json.loads(processed_file.read_text())
-                return set(data)
+                lines = [line for line in processed_file.read_bytes().split(b'\n') if line.strip()]
+            except Exception as e:
+                # Keep the log untouched; appends still work, compaction is disabled
+                logger.error(f"Failed to load processed issues: {e}")
+                self._processed_load_ok = False
+                return processed
+
+            bad_lines = []
+            for number, line in enumerate(lines, 1):
+                try:
+                    self.add_processed_entry(processed, json_loads(line))
+                except Exception:
+                    bad_lines.append(number)
+
+            if bad_lines == [len(lines)]:
+                # Half-written last entry (e.g. crash mid-append): drop it and rewrite a clean log
+                logger.warning(f"Skipping incomplete last line in {processed_file}")
+                self.processed_issues = processed
+                self.save_processed_issues()
+            elif bad_lines:
+                logger.error(f"Corrupt entries in {processed_file} (lines {bad_lines}); "
+                             f"not compacting until the file is repaired")
+                self._processed_load_ok = False
+            return processed
+
+        # Migrate from the pre-JSONL format (single JSON array)
+        legacy_file = data_dir / 'processed_issues.json'
+        if legacy_file.exists():
+            try:
+                for entry in json_loads(legacy_file.read_bytes()):
+                    self.add_processed_entry(processed, entry)
+                self.processed_issues = processed
+                self.save_processed_issues()
+                logger.info(f"Migrated {sum(len(ids) for ids in processed.values())} processed issue(s) to {processed_file}")
+                return processed
             except Exception as e:
-                logger.warning(f"Failed to load processed issues: {e}")
-                return set()
-        return set()
+                logger.error(f"Failed to migrate processed issues: {e}")
+                self._processed_load_ok = False
+                return defaultdict(set)
+        return processed
+
+    @staticmethod
+    def add_processed_entry(processed: Dict[str, Set[int]], entry):
+        """Add one log entry: [project-id, issue-number] or legacy 'project-id:issue-number'"""
+        if isinstance(entry, str):
+            project_id, issue_id = entry.rsplit(':', 1)
+            entry = [project_id, int(issue_id)]
+        processed[entry[0]].add(entry[1])
 
     def save_processed_issues(self):
-        """Save processed issue IDs to disk"""
+        """Compact processed issue log to one line per issue"""
+        if not self._processed_load_ok:
+            # In-memory set may be missing history that is still in the log
+            return
+
         data_dir = Path.home() / '.config' / 'lazy_birtd' / 'data'
         data_dir.mkdir(parents=True, exist_ok=True)
 
-        processed_file = data_dir / 'processed_issues.json'
+        processed_file = data_dir / 'processed_issues.jsonl'
         try:
-            processed_file.write_text(json.dumps(list(self.processed_issues), indent=2))
+            if self._processed_log:
+                self._processed_log.close()
+                self._processed_log = None
+
+            # Write to temp file and swap in atomically
+            tmp_file = processed_file.with_suffix('.tmp')
+            tmp_file.write_bytes(b''.join(
+                json_dumps([project_id, issue_id]) + b'\n'
+                for project_id, issue_ids in self.processed_issues.items()
+                for issue_id in issue_ids
+            ))
+            tmp_file.replace(processed_file)
+            self._processed_appends = 0
         except Exception as e:
             logger.error(f"Failed to save processed issues: {e}")
 
+    def mark_processed(self, project_id: str, issue_id: int):
+        """Record issue as processed, appending it to the on-disk log"""
+        self.processed_issues[project_id].add(issue_id)
+
+        try:
+            if not self._processed_log:
+                processed_file = Path.home() / '.config' / 'lazy_birtd' / 'data' / 'processed_issues.jsonl'
+                self._processed_log = open(processed_file, 'ab', buffering=0)
+                # Never glue a new entry onto an unterminated last line
+                if self._processed_log.tell():
+                    with open(processed_file, 'rb') as f:
+                        f.seek(-1, 2)
+                        if f.read(1) != b'\n':
+                            self._processed_log.write(b'\n')
+            self._processed_log.write(json_dumps([project_id, issue_id]) + b'\n')
+            self._processed_appends += 1
+        except Exception as e:
+            logger.error(f"Failed to record processed issue: {e}")
+
+        # Periodically rewrite the log to drop duplicate entries
+        if self._processed_load_ok and self._processed_appends >= PROCESSED_LOG_COMPACT_EVERY:
+            self.save_processed_issues()
+
+    def load_etags(self) -> Dict[str, Dict]:
+        """Load per-project ETag cache (format: project-id -> url -> {etag, issues})"""
+        data_dir = Path.home() / '.config' / 'lazy_birtd' / 'data'
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        etags_file = data_dir / 'etags.json'
+        if etags_file.exists():
+            try:
+                return json_loads(etags_file.read_bytes())
+            except Exception as e:
+                logger.warning(f"Failed to load ETag cache: {e}")
+                return {}
+        return {}
+
+    def save_etags(self):
+        """Save per-project ETag cache to disk if any project changed it"""
+        if not any(pw.etag_cache_dirty for pw in self.project_watchers):
+            return
+
+        data_dir = Path.home() / '.config' / 'lazy_birtd' / 'data'
+        data_dir.mkdir(parents=True, exist_ok=True)
+
+        etags_file = data_dir / 'etags.json'
+        etags = {pw.project_id: pw.etag_cache for pw in self.project_watchers}
+        try:
+            # Write to temp file and swap in atomically
+            tmp_file = etags_file.with_suffix('.tmp')
+            tmp_file.write_bytes(json_dumps(etags))
+            tmp_file.replace(etags_file)
+            for project_watcher in self.project_watchers:
+                project_watcher.etag_cache_dirty = False
+        except Exception as e:
+            logger.error(f"Failed to save ETag cache: {e}")
+
     def queue_task(self, parsed_issue: Dict, project_watcher: ProjectWatcher):
         """Add task to processing queue with project context"""
         queue_dir = Path('/var/lib/lazy_birtd/queue')
@@ -473,14 +822,119 @@ class IssueWatcher:
         task_file = queue_dir / f"task-{task_id}.json"
 
         try:
-            task_file.write_text(json.dumps(parsed_issue, indent=2))
+            # Write to temp file and swap in atomically so consumers never see a partial task
+            tmp_file = task_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(json_dumps(parsed_issue, indent=True))
+            tmp_file.replace(task_file)
             logger.info(f"[{project_watcher.project_id}] ✅ Queued task #{parsed_issue['issue_id']}: {parsed_issue['title']}")
         except Exception as e:
             logger.error(f"[{project_watcher.project_id}] Failed to queue task: {e}")
             raise
 
+    def process_issues(self, project_watcher: ProjectWatcher, issues: List[Dict], label_updates: List[Future]) -> int:
+        """Queue issues not yet processed, returns number of new issues"""
+        with self._process_lock:
+            # Filter out already-processed issues for this project
+            processed = self.processed_issues[project_watcher.project_id]
+            new_issues = [issue for issue in issues if issue['id'] not in processed]
+
+            if new_issues:
+                logger.info(f"[{project_watcher.project_id}] Found {len(new_issues)} new task(s)")
+
+            # Process each new issue
+            queued: List[Dict] = []
+            try:
+                for issue in new_issues:
+                    logger.info(f"[{project_watcher.project_id}] Processing issue #{issue['id']}: {issue['title']}")
+
+                    # Parse issue into task format (includes project context)
+                    parsed = project_watcher.parse_issue(issue)
+
+                    # Queue the task
+                    self.queue_task(parsed, project_watcher)
+                    queued.append(issue)
+
+                    # Mark as processed (per project)
+                    self.mark_processed(project_watcher.project_id, issue['id'])
+
+                    logger.info(f"[{project_watcher.project_id}] ✅ Issue #{issue['id']} queued successfully")
+            finally:
+                # Update labels in the background (one task per project, awaited by caller),
+                # including issues queued before a later one failed
+                if queued:
+                    label_updates.append(self.executor.submit(project_watcher.update_labels, queued))
+
+            return len(new_issues)
+
+    def load_webhook_secret(self) -> bytes:
+        """Load shared webhook secret from secrets directory"""
+        secret_file = Path.home() / '.config' / 'lazy_birtd' / 'secrets' / 'webhook_secret'
+        if not secret_file.exists():
+            return b''
+        return secret_file.read_text().strip().encode()
+
+    def start_webhook_server(self):
+        """Start webhook receiver thread; GitHub polling drops to a failsafe interval"""
+        self.webhook_secret = self.load_webhook_secret()
+        if not self.webhook_secret:
+            logger.error("webhook_port is set but webhook secret not found, webhooks disabled")
+            logger.error("Create secret file: openssl rand -hex 32 > ~/.config/lazy_birtd/secrets/webhook_secret")
+            return
+
+        try:
+            self.webhook_server = ThreadingHTTPServer((self.webhook_host, int(self.webhook_port)), WebhookHandler)
+        except Exception as e:
+            logger.error(f"Failed to start webhook receiver on {self.webhook_host or '*'}:{self.webhook_port}: {e}")
+            return
+
+        self.webhook_server.watcher = self
+        threading.Thread(target=self.webhook_server.serve_forever, name='webhook', daemon=True).start()
+
+        # Subscribe repositories if a public URL for the receiver is configured
+        webhook_url = self.config.get('webhook_url')
+        if webhook_url:
+            for project_watcher in self.project_watchers:
+                if project_watcher.platform == 'github':
+                    project_watcher.ensure_github_webhook(webhook_url, self.webhook_secret.decode())
+
+        # Webhooks deliver new GitHub issues; keep polling those only as a failsafe
+        for project_watcher in self.project_watchers:
+            if project_watcher.platform == 'github':
+                project_watcher.poll_interval = max(project_watcher.poll_interval, WEBHOOK_FALLBACK_POLL_SECONDS)
+
+        logger.info(f"Webhook receiver listening on {self.webhook_host or '*'}:{self.webhook_port}")
+        logger.info(f"  GitHub projects polled every {WEBHOOK_FALLBACK_POLL_SECONDS}s as failsafe")
+
+    def handle_webhook_event(self, payload: Dict):
+        """Queue the issue from an 'issues' event if it is open and labeled 'ready'"""
+        if payload.get('action') not in ['opened', 'reopened', 'labeled']:
+            return
+
+        issue = payload['issue']
+        if issue.get('state') != 'open' or 'ready' not in [l['name'] for l in issue['labels']]:
+            return
+
+        repo_name = payload['repository']['full_name'].lower()
+        for project_watcher in self.project_watchers:
+            if project_watcher.platform == 'github' and f"{project_watcher.owner}/{project_watcher.repo}".lower() == repo_name:
+                label_updates: List[Future] = []
+                self.process_issues(project_watcher, [project_watcher.github_issue_fields(issue)], label_updates)
+                wait(label_updates)
+
+    def close(self):
+        """Release resources held by project watchers"""
+        if self.webhook_server:
+            self.webhook_server.shutdown()
+        self.executor.shutdown(wait=False)
+        self.save_processed_issues()
+        for project_watcher in self.project_watchers:
+            project_watcher.close()
+
     def run(self):
         """Main loop - poll all projects for issues and process them"""
+        if self.webhook_port:
+            self.start_webhook_server()
+
         project_names = ', '.join([pw.project_name for pw in self.project_watchers])
         logger.info(f"🔍 Issue Watcher started (Phase 1.1 Multi-Project)")
         logger.info(f"   Projects: {project_names}")
@@ -491,57 +945,44 @@ class IssueWatcher:
         while True:
             try:
                 total_new_issues = 0
-
-                # Poll each project in sequence
-                for project_watcher in self.project_watchers:
+                label_updates = []
+
+                # Fetch all due projects concurrently, process results on this thread
+                now = time.time()
+                futures = {
+                    self.executor.submit(pw.fetch_ready_issues): pw
+                    for pw in self.project_watchers
+                    if pw.next_allowed_poll <= now
+                }
+
+                for future in as_completed(futures):
+                    project_watcher = futures[future]
                     try:
-                        # Fetch issues with 'ready' label for this project
-                        issues = project_watcher.fetch_ready_issues()
-
-                        # Filter out already-processed issues (using project-id:issue-number format)
-                        new_issues = []
-                        for issue in issues:
-                            issue_key = f"{project_watcher.project_id}:{issue['id']}"
-                            if issue_key not in self.processed_issues:
-                                new_issues.append(issue)
-
-                        if new_issues:
-                            logger.info(f"[{project_watcher.project_id}] Found {len(new_issues)} new task(s)")
-                            total_new_issues += len(new_issues)
-
-                        # Process each new issue
-                        for issue in new_issues:
-                            logger.info(f"[{project_watcher.project_id}] Processing issue #{issue['id']}: {issue['title']}")
-
-                            # Parse issue into task format (includes project context)
-                            parsed = project_watcher.parse_issue(issue)
-
-                            # Queue the task
-                            self.queue_task(parsed, project_watcher)
-
-                            # Update labels on the issue
-                            project_watcher.update_issue_labels(issue)
-
-                            # Mark as processed (project-id:issue-number)
-                            issue_key = f"{project_watcher.project_id}:{issue['id']}"
-                            self.processed_issues.add(issue_key)
-                            self.save_processed_issues()
-
-                            logger.info(f"[{project_watcher.project_id}] ✅ Issue #{issue['id']} queued successfully")
+                        # Issues with 'ready' label for this project
+                        issues = future.result()
+                        total_new_issues += self.process_issues(project_watcher, issues, label_updates)
 
                     except Exception as e:
                         logger.error(f"[{project_watcher.project_id}] Error processing project: {e}")
                         # Continue to next project instead of crashing
 
+                # Wait for outstanding label updates before the next cycle
+                wait(label_updates)
+
+                # Persist ETags so restarts can issue conditional requests
+                self.save_etags()
+
                 # Log summary if any new issues found
                 if total_new_issues == 0:
                     logger.debug(f"No new issues found across {len(self.project_watchers)} projects")
 
-                # Sleep until next poll
-                time.sleep(self.poll_interval)
+                # Sleep until the next project is due for polling
+                next_poll = min(pw.next_allowed_poll for pw in self.project_watchers)
+                time.sleep(max(1.0, next_poll - time.time()))
 
             except KeyboardInterrupt:
                 logger.info("\n👋 Shutting down gracefully...")
+                self.close()
                 break
             except Exception as e:
                 logger.error(f"❌ Unexpected error in main loop: {e}")
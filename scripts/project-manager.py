@@ -4,23 +4,71 @@ Lazy_Bird Project Manager CLI
 Manage multiple projects in Phase 1.1 multi-project configuration
 """
 
+import os
 import sys
+import stat
+import pickle
+import hashlib
 import argparse
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, NoReturn, Optional, Union
 import json
 
+# Parsed project entry / configuration (YAML mappings)
+Project = Dict[str, Any]
+Config = Dict[str, Any]
 
-def load_config(config_path: Path) -> Dict:
-    """Load configuration from YAML file"""
+# Project fields that must be present and non-empty
+REQUIRED_FIELDS = ('id', 'name', 'type', 'path', 'repository', 'git_platform', 'test_command')
+
+# Supported git platforms
+GIT_PLATFORMS = frozenset(('github', 'gitlab'))
+
+# Translation table dropping the separators allowed in project IDs
+_ID_SEPARATORS = str.maketrans('', '', '-_')
+
+
+def config_cache_path(config_path: Path) -> Path:
+    """Path of the parsed-config pickle cache in the user's private cache directory"""
+    cache_dir = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'lazy_birtd'
+    digest = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()[:16]
+    return cache_dir / f'config-{digest}.pkl'
+
+
+def is_private(st: os.stat_result) -> bool:
+    """True if owned by the current user and not writable by group/others"""
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def load_config(config_path: Path) -> Config:
+    """Load configuration from YAML file (or its cache if the file is unchanged)"""
     if not config_path.exists():
         print(f"Error: Configuration file not found: {config_path}", file=sys.stderr)
         sys.exit(1)
 
+    # Reuse the cached parse if the YAML file hasn't changed since it was written.
+    # The pickle is only trusted if it and its directory are private to this user.
+    cache_path = config_cache_path(config_path)
+    st = config_path.stat()
+    cache_key = (str(config_path.resolve()), st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
     try:
-        import yaml
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        with open(cache_path, 'rb') as f:
+            if is_private(os.fstat(f.fileno())) and is_private(cache_path.parent.stat()):
+                cached_key, config = pickle.load(f)
+                if cached_key == cache_key:
+                    return config
+    except Exception:
+        pass
+
+    try:
+        import yaml  # type: ignore[import-untyped]
+        # Prefer libyaml C loader when available
+        try:
+            from yaml import CSafeLoader as Loader
+        except ImportError:
+            from yaml import SafeLoader as Loader  # type: ignore[assignment]
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=Loader)
     except ImportError:
         print("Error: PyYAML not installed. Install with: pip3 install pyyaml", file=sys.stderr)
         sys.exit(1)
@@ -28,19 +76,51 @@ def load_config(config_path: Path) -> Dict:
         print(f"Error loading configuration: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Cache is best effort; a failed write only means parsing again next time
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            pickle.dump((cache_key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+
+    return config
 
-def save_config(config_path: Path, config: Dict):
+
+def save_config(config_path: Path, config: Config) -> None:
     """Save configuration to YAML file"""
     try:
-        import yaml
-        # Backup existing config
+        import yaml  # type: ignore[import-untyped]
+        # Prefer libyaml C dumper when available
+        try:
+            from yaml import CSafeDumper as Dumper
+        except ImportError:
+            from yaml import SafeDumper as Dumper  # type: ignore[assignment]
+        # Invalidate parsed-config cache
+        config_cache_path(config_path).unlink(missing_ok=True)
+
+        # Write new config next to the old one first
+        tmp_path = config_path.with_suffix('.yml.tmp')
+        with open(tmp_path, 'w') as f:
+            yaml.dump(config, f, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Backup existing config as a hardlink (no data copy, original stays in place)
         if config_path.exists():
             backup_path = config_path.with_suffix('.yml.backup')
-            config_path.rename(backup_path)
+            backup_path.unlink(missing_ok=True)
+            try:
+                os.link(config_path, backup_path)
+            except OSError:
+                # Filesystem without hardlink support
+                config_path.rename(backup_path)
             print(f"✅ Backup created: {backup_path}")
 
-        with open(config_path, 'w') as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
+        # Atomically swap in the new config
+        os.replace(tmp_path, config_path)
 
         print(f"✅ Configuration saved: {config_path}")
     except Exception as e:
@@ -48,38 +128,53 @@ def save_config(config_path: Path, config: Dict):
         sys.exit(1)
 
 
-def get_projects(config: Dict) -> List[Dict]:
+def get_projects(config: Config) -> List[Project]:
     """Get projects list from config"""
     if 'projects' in config and config['projects']:
         return config['projects']
     return []
 
 
-def find_project(projects: List[Dict], project_id: str) -> Optional[Dict]:
-    """Find project by ID"""
+def project_positions(projects: List[Project]) -> Dict[str, int]:
+    """Map project ID to its position in the projects list (first occurrence wins)"""
+    positions: Dict[str, int] = {}
+    for i, project in enumerate(projects):
+        if 'id' in project:
+            positions.setdefault(project['id'], i)
+    return positions
+
+
+def index_projects(projects: List[Project]) -> Dict[str, Project]:
+    """Build project ID -> project lookup for O(1) access"""
+    return {project_id: projects[i] for project_id, i in project_positions(projects).items()}
+
+
+def find_project(projects: Union[List[Project], Dict[str, Project]], project_id: str) -> Optional[Project]:
+    """Find project by ID in a projects list or an index from index_projects()"""
+    if isinstance(projects, dict):
+        return projects.get(project_id)
     for project in projects:
         if project.get('id') == project_id:
             return project
     return None
 
 
-def validate_project(project: Dict, allow_partial: bool = False) -> List[str]:
+def validate_project(project: Project, allow_partial: bool = False) -> List[str]:
     """Validate project fields, return list of errors"""
-    required_fields = ['id', 'name', 'type', 'path', 'repository', 'git_platform', 'test_command']
-    errors = []
+    errors: List[str] = []
 
     if not allow_partial:
-        for field in required_fields:
+        for field in REQUIRED_FIELDS:
             if field not in project or not project[field]:
                 errors.append(f"Missing required field: {field}")
 
     # Validate field formats
     if 'id' in project:
         project_id = project['id']
-        if not project_id or not project_id.replace('-', '').replace('_', '').isalnum():
+        if not project_id or not project_id.translate(_ID_SEPARATORS).isalnum():
             errors.append(f"Invalid project ID: '{project_id}' (must be alphanumeric with dashes/underscores)")
 
-    if 'git_platform' in project and project['git_platform'] not in ['github', 'gitlab']:
+    if 'git_platform' in project and project['git_platform'] not in GIT_PLATFORMS:
         errors.append(f"Invalid git_platform: '{project['git_platform']}' (must be 'github' or 'gitlab')")
 
     if 'path' in project:
@@ -92,7 +187,7 @@ def validate_project(project: Dict, allow_partial: bool = False) -> List[str]:
     return errors
 
 
-def cmd_list(args):
+def cmd_list(args: argparse.Namespace) -> None:
     """List all projects"""
     config = load_config(args.config)
     projects = get_projects(config)
@@ -127,12 +222,13 @@ def cmd_list(args):
         print()
 
 
-def cmd_show(args):
+def cmd_show(args: argparse.Namespace) -> None:
     """Show detailed information about a specific project"""
     config = load_config(args.config)
     projects = get_projects(config)
+    index = index_projects(projects)
 
-    project = find_project(projects, args.project_id)
+    project = find_project(index, args.project_id)
     if not project:
         print(f"Error: Project not found: {args.project_id}", file=sys.stderr)
         sys.exit(1)
@@ -149,7 +245,7 @@ def cmd_show(args):
     print()
 
 
-def cmd_add(args):
+def cmd_add(args: argparse.Namespace) -> None:
     """Add a new project"""
     config = load_config(args.config)
 
@@ -160,7 +256,7 @@ def cmd_add(args):
     projects = config['projects']
 
     # Check if project ID already exists
-    if find_project(projects, args.id):
+    if find_project(index_projects(projects), args.id):
         print(f"Error: Project with ID '{args.id}' already exists", file=sys.stderr)
         sys.exit(1)
 
@@ -196,15 +292,17 @@ def cmd_add(args):
     print(f"✅ Project '{args.id}' added successfully")
 
 
-def cmd_remove(args):
+def cmd_remove(args: argparse.Namespace) -> None:
     """Remove a project"""
     config = load_config(args.config)
     projects = get_projects(config)
+    positions = project_positions(projects)
 
-    project = find_project(projects, args.project_id)
-    if not project:
+    position = positions.get(args.project_id)
+    if position is None:
         print(f"Error: Project not found: {args.project_id}", file=sys.stderr)
         sys.exit(1)
+    project = projects[position]
 
     # Confirm deletion
     if not args.yes:
@@ -217,7 +315,7 @@ def cmd_remove(args):
             return
 
     # Remove
-    projects.remove(project)
+    del projects[position]
     config['projects'] = projects
 
     # Save
@@ -225,12 +323,13 @@ def cmd_remove(args):
     print(f"✅ Project '{args.project_id}' removed successfully")
 
 
-def cmd_edit(args):
+def cmd_edit(args: argparse.Namespace) -> None:
     """Edit a project field"""
     config = load_config(args.config)
     projects = get_projects(config)
+    index = index_projects(projects)
 
-    project = find_project(projects, args.project_id)
+    project = find_project(index, args.project_id)
     if not project:
         print(f"Error: Project not found: {args.project_id}", file=sys.stderr)
         sys.exit(1)
@@ -259,12 +358,13 @@ def cmd_edit(args):
     print(f"✅ Project '{args.project_id}' updated successfully")
 
 
-def cmd_enable(args):
+def cmd_enable(args: argparse.Namespace) -> None:
     """Enable a project"""
     config = load_config(args.config)
     projects = get_projects(config)
+    index = index_projects(projects)
 
-    project = find_project(projects, args.project_id)
+    project = find_project(index, args.project_id)
     if not project:
         print(f"Error: Project not found: {args.project_id}", file=sys.stderr)
         sys.exit(1)
@@ -279,12 +379,13 @@ def cmd_enable(args):
     print(f"✅ Project '{args.project_id}' enabled")
 
 
-def cmd_disable(args):
+def cmd_disable(args: argparse.Namespace) -> None:
     """Disable a project"""
     config = load_config(args.config)
     projects = get_projects(config)
+    index = index_projects(projects)
 
-    project = find_project(projects, args.project_id)
+    project = find_project(index, args.project_id)
     if not project:
         print(f"Error: Project not found: {args.project_id}", file=sys.stderr)
         sys.exit(1)
@@ -299,9 +400,100 @@ def cmd_disable(args):
     print(f"✅ Project '{args.project_id}' disabled")
 
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
+def _build_list(subparsers: Any) -> None:
+    parser_list = subparsers.add_parser('list', help='List all projects')
+    parser_list.set_defaults(func=cmd_list)
+
+
+def _build_show(subparsers: Any) -> None:
+    parser_show = subparsers.add_parser('show', help='Show detailed project information')
+    parser_show.add_argument('project_id', help='Project ID')
+    parser_show.set_defaults(func=cmd_show)
+
+
+def _build_add(subparsers: Any) -> None:
+    parser_add = subparsers.add_parser('add', help='Add a new project')
+    parser_add.add_argument('--id', required=True, help='Unique project ID (alphanumeric with dashes)')
+    parser_add.add_argument('--name', required=True, help='Project display name')
+    parser_add.add_argument('--type', required=True, help='Project type (godot, python, rust, nodejs, etc.)')
+    parser_add.add_argument('--path', required=True, help='Absolute path to project directory')
+    parser_add.add_argument('--repository', required=True, help='Git repository URL')
+    parser_add.add_argument('--git-platform', required=True, choices=['github', 'gitlab'], help='Git platform')
+    parser_add.add_argument('--test-command', required=True, help='Command to run tests')
+    parser_add.add_argument('--build-command', help='Command to build (optional)')
+    parser_add.add_argument('--lint-command', help='Command to lint code (optional)')
+    parser_add.add_argument('--format-command', help='Command to format code (optional)')
+    parser_add.set_defaults(func=cmd_add)
+
+
+def _build_remove(subparsers: Any) -> None:
+    parser_remove = subparsers.add_parser('remove', help='Remove a project')
+    parser_remove.add_argument('project_id', help='Project ID to remove')
+    parser_remove.add_argument('-y', '--yes', action='store_true', help='Skip confirmation')
+    parser_remove.set_defaults(func=cmd_remove)
+
+
+def _build_edit(subparsers: Any) -> None:
+    parser_edit = subparsers.add_parser('edit', help='Edit a project field')
+    parser_edit.add_argument('project_id', help='Project ID')
+    parser_edit.add_argument('--field', required=True, help='Field to edit')
+    parser_edit.add_argument('--value', required=True, help='New value')
+    parser_edit.add_argument('--force', action='store_true', help='Force save even if validation fails')
+    parser_edit.set_defaults(func=cmd_edit)
+
+
+def _build_enable(subparsers: Any) -> None:
+    parser_enable = subparsers.add_parser('enable', help='Enable a project')
+    parser_enable.add_argument('project_id', help='Project ID to enable')
+    parser_enable.set_defaults(func=cmd_enable)
+
+
+def _build_disable(subparsers: Any) -> None:
+    parser_disable = subparsers.add_parser('disable', help='Disable a project')
+    parser_disable.add_argument('project_id', help='Project ID to disable')
+    parser_disable.set_defaults(func=cmd_disable)
+
+
+# Subcommand parser builders, in help order
+BUILDERS: Dict[str, Callable[[Any], None]] = {
+    'list': _build_list,
+    'show': _build_show,
+    'add': _build_add,
+    'remove': _build_remove,
+    'edit': _build_edit,
+    'enable': _build_enable,
+    'disable': _build_disable,
+}
+
+
+def peek_command(argv: List[str]) -> Optional[str]:
+    """Return the subcommand name from argv, or None if help is requested first"""
+    args = iter(argv)
+    for arg in args:
+        if arg in ('-h', '--help'):
+            return None
+        if arg == '--config':
+            next(args, None)
+        elif not arg.startswith('-'):
+            return arg
+    return None
+
+
+class _ParseError(Exception):
+    """Raised by _LazyArgumentParser instead of printing usage and exiting"""
+
+
+class _LazyArgumentParser(argparse.ArgumentParser):
+    """Parser for a partially built CLI; errors are re-raised against the full CLI"""
+
+    def error(self, message: str) -> NoReturn:
+        raise _ParseError(message)
+
+
+def build_parser(commands: List[str],
+                 parser_class: type = argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """Build the CLI parser with subparsers for the given commands"""
+    parser = parser_class(
         description='Lazy_Bird Project Manager - Manage multiple project configurations',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
@@ -339,61 +531,35 @@ Examples:
     parser.add_argument(
         '--config',
         type=Path,
-        default=Path.home() / '.config' / 'lazy_birtd' / 'config.yml',
+        default=None,
         help='Path to configuration file (default: ~/.config/lazy_birtd/config.yml)'
     )
 
     subparsers = parser.add_subparsers(dest='command', help='Command to execute')
+    for command in commands:
+        BUILDERS[command](subparsers)
 
-    # list command
-    parser_list = subparsers.add_parser('list', help='List all projects')
-    parser_list.set_defaults(func=cmd_list)
-
-    # show command
-    parser_show = subparsers.add_parser('show', help='Show detailed project information')
-    parser_show.add_argument('project_id', help='Project ID')
-    parser_show.set_defaults(func=cmd_show)
-
-    # add command
-    parser_add = subparsers.add_parser('add', help='Add a new project')
-    parser_add.add_argument('--id', required=True, help='Unique project ID (alphanumeric with dashes)')
-    parser_add.add_argument('--name', required=True, help='Project display name')
-    parser_add.add_argument('--type', required=True, help='Project type (godot, python, rust, nodejs, etc.)')
-    parser_add.add_argument('--path', required=True, help='Absolute path to project directory')
-    parser_add.add_argument('--repository', required=True, help='Git repository URL')
-    parser_add.add_argument('--git-platform', required=True, choices=['github', 'gitlab'], help='Git platform')
-    parser_add.add_argument('--test-command', required=True, help='Command to run tests')
-    parser_add.add_argument('--build-command', help='Command to build (optional)')
-    parser_add.add_argument('--lint-command', help='Command to lint code (optional)')
-    parser_add.add_argument('--format-command', help='Command to format code (optional)')
-    parser_add.set_defaults(func=cmd_add)
-
-    # remove command
-    parser_remove = subparsers.add_parser('remove', help='Remove a project')
-    parser_remove.add_argument('project_id', help='Project ID to remove')
-    parser_remove.add_argument('-y', '--yes', action='store_true', help='Skip confirmation')
-    parser_remove.set_defaults(func=cmd_remove)
-
-    # edit command
-    parser_edit = subparsers.add_parser('edit', help='Edit a project field')
-    parser_edit.add_argument('project_id', help='Project ID')
-    parser_edit.add_argument('--field', required=True, help='Field to edit')
-    parser_edit.add_argument('--value', required=True, help='New value')
-    parser_edit.add_argument('--force', action='store_true', help='Force save even if validation fails')
-    parser_edit.set_defaults(func=cmd_edit)
-
-    # enable command
-    parser_enable = subparsers.add_parser('enable', help='Enable a project')
-    parser_enable.add_argument('project_id', help='Project ID to enable')
-    parser_enable.set_defaults(func=cmd_enable)
+    return parser
 
-    # disable command
-    parser_disable = subparsers.add_parser('disable', help='Disable a project')
-    parser_disable.add_argument('project_id', help='Project ID to disable')
-    parser_disable.set_defaults(func=cmd_disable)
 
-    # Parse args
-    args = parser.parse_args()
+def main() -> None:
+    """Main CLI entry point"""
+    # Only build the subparser being invoked; build all for help and unknown commands
+    command = peek_command(sys.argv[1:])
+    if command in BUILDERS:
+        try:
+            parser = build_parser([command], _LazyArgumentParser)
+            args = parser.parse_args()
+        except _ParseError:
+            # Re-parse with every subcommand so errors show the full usage
+            parser = build_parser(list(BUILDERS))
+            args = parser.parse_args()
+    else:
+        parser = build_parser(list(BUILDERS))
+        args = parser.parse_args()
+
+    if args.config is None:
+        args.config = Path.home() / '.config' / 'lazy_birtd' / 'config.yml'
 
     if not args.command:
         parser.print_help()